@@ -1,8 +1,9 @@
+import sys
 from dataclasses import dataclass
 from typing import Dict, Literal, Union
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DepositPlan:
     """
     Represents a deposit plan for a user.
@@ -10,10 +11,21 @@ class DepositPlan:
     Attributes:
         plan_type (str): The type of the deposit plan, either 'one_time' or 'monthly'.
         portfolio_allocation (Dict[str, float]): A dictionary representing the allocation of the deposit across different portfolios.
+            The plan keeps its own copy, so later changes to the dictionary passed in are not reflected.
     """
     plan_type: Union[Literal['one_time'], Literal['monthly']]
     portfolio_allocation: Dict[str, float]
 
+    def __post_init__(self):
+        # Intern portfolio names so dict lookups across plans, pots and results can match keys by identity.
+        # sys.intern only accepts exact str, so str subclasses (e.g. StrEnum members) are kept as they are.
+        # The dataclass is frozen, hence the field is set through object.__setattr__
+        portfolio_allocation = {
+            sys.intern(portfolio) if type(portfolio) is str else portfolio: amount
+            for portfolio, amount in self.portfolio_allocation.items()
+        }
+        object.__setattr__(self, 'portfolio_allocation', portfolio_allocation)
+
     def get_total_allocation(self) -> float:
         """
         Returns the total allocation across all portfolios.
@@ -1,18 +1,55 @@
-from dataclasses import dataclass
+from collections import defaultdict
+from dataclasses import dataclass, field
 from typing import Dict
 
-@dataclass
+@dataclass(slots=True)
 class DepositPot:
     """
     Represents a deposit plan for a user.
     
     Attributes:
         id (str): The unique identifier of the deposit plan.
-        portfolio_allocation_limit (Dict[str, float]): A dictionary representing the maximum allocation limit for each portfolio
+        portfolio_allocation_limit (Dict[str, float]): A dictionary representing the maximum allocation limit for each portfolio.
+            It is only read, never mutated, so it can be shared with the deposit plan it comes from.
         portfolio_allocation (Dict[str, float]): A dictionary representing the actual allocation of the deposit across different portfolios.
+            It should only be updated through allocate_deposit, which keeps the cached allocation total in sync.
     """
     portfolio_allocation_limit: Dict[str, float]
     portfolio_allocation: Dict[str, float]
+    _total_limit: float = field(init=False, repr=False, compare=False)
+    _ratios: Dict[str, float] = field(init=False, repr=False, compare=False)
+    _allocated_total: float = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.portfolio_allocation = defaultdict(float, self.portfolio_allocation)
+        self._cache_allocation_limit()
+
+        # Running total of the allocation, kept up to date by allocate_deposit
+        self._allocated_total = sum(self.portfolio_allocation.values())
+
+    def reset(self, portfolio_allocation_limit: Dict[str, float]) -> None:
+        """
+        Empties the deposit pot and sets new allocation limits so the pot can be reused.
+        The portfolio allocation dictionary is cleared in place.
+
+        Args:
+            portfolio_allocation_limit (Dict[str, float]): The new maximum allocation limit for each portfolio.
+        """
+        self.portfolio_allocation_limit = portfolio_allocation_limit
+        self.portfolio_allocation.clear()
+        self._cache_allocation_limit()
+        self._allocated_total = 0.0
+
+    def _cache_allocation_limit(self) -> None:
+        """
+        Computes the total allocation limit and the allocation ratios.
+        Limits do not change until the pot is reset, so they are computed once.
+        """
+        self._total_limit = sum(self.portfolio_allocation_limit.values())
+        if self._total_limit == 0:
+            self._ratios = {key: 0.0 for key in self.portfolio_allocation_limit.keys()}
+        else:
+            self._ratios = {key: value / self._total_limit for key, value in self.portfolio_allocation_limit.items()}
 
     def allocate_deposit(self, deposit_amount: float) -> float:
         """
@@ -25,19 +62,24 @@ class DepositPot:
             float: The excess amount that could not be allocated
         """
 
-        # Get excess amount and deposit amount
-        remaining_allocation = self.get_remaining_allocation_total_amount()
-        if deposit_amount > remaining_allocation:
-            excess_amount = deposit_amount - remaining_allocation
-            deposit_amount = remaining_allocation
-        else:
-            excess_amount = 0.0
+        # Get excess amount and deposit amount, capping the deposit at the remaining allocation
+        remaining_allocation = self._total_limit - self._allocated_total
+        take = deposit_amount if deposit_amount < remaining_allocation else remaining_allocation
+        excess_amount = deposit_amount - take
+        if self._total_limit == 0:
+            # All ratios are zero, so nothing is written and the running total must not move either
+            return excess_amount
+        if take == 0.0:
+            # Nothing to allocate (zero deposit or the pot is already full)
+            return excess_amount
+        deposit_amount = take
 
         # Allocate the deposit amount to each portfolio according to the allocation ratios
-        allocation_ratios = self.get_portfolio_allocation_ratio()
-        for portfolio, _ in self.portfolio_allocation_limit.items():
-            portfolio_allocation = allocation_ratios.get(portfolio, 0.0) * deposit_amount
-            self.portfolio_allocation[portfolio] = self.portfolio_allocation.get(portfolio, 0.0) + portfolio_allocation
+        # in a single pass over the cached ratios
+        portfolio_allocation = self.portfolio_allocation
+        for portfolio, ratio in self._ratios.items():
+            portfolio_allocation[portfolio] += ratio * deposit_amount
+        self._allocated_total += deposit_amount
         
         return excess_amount
 
@@ -48,19 +90,17 @@ class DepositPot:
         Returns:
             float: The total remaining allocation amount.
         """
-        return sum(self.portfolio_allocation_limit.values()) - sum(self.portfolio_allocation.values())
+        return self._total_limit - self._allocated_total
 
     def get_portfolio_allocation_ratio(self) -> Dict[str, float]:
         """
         Returns the portfolio allocation ratios for the deposit plan.
+        The ratios are computed once on construction and must not be mutated.
 
         Returns:
             Dict[str, float]: A dictionary mapping portfolio names to their allocation ratios.
         """
-        total_allocation = sum(self.portfolio_allocation_limit.values())
-        if total_allocation == 0:
-            return {key: 0.0 for key in self.portfolio_allocation_limit.keys()}
-        return {key: value / total_allocation for key, value in self.portfolio_allocation_limit.items()}
+        return self._ratios
 
     def get_total_allocation_limit(self) -> float:
         """
@@ -69,7 +109,7 @@ class DepositPot:
         Returns:
             float: The total allocation limit amount.
         """
-        return sum(self.portfolio_allocation_limit.values())
+        return self._total_limit
 
     def get_total_allocation_amount(self) -> float:
         """
@@ -78,7 +118,7 @@ class DepositPot:
         Returns:
             float: The total allocation amount.
         """
-        return sum(self.portfolio_allocation.values())
+        return self._allocated_total
 
     def is_full(self) -> bool:
         """
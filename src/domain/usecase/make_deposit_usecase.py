@@ -1,5 +1,6 @@
 from abc import ABC
-from typing import List, Dict
+from collections import defaultdict
+from typing import DefaultDict, List, Dict
 
 from domain.entity.deposit_plan_entity import DepositPlan
 from domain.entity.deposit_entity import Deposit
@@ -12,10 +13,11 @@ class MakeDepositUsecase(ABC):
     """
     def execute(self, deposit_plan_list: List[DepositPlan], deposit_list: List[Deposit]) -> Dict[str, float]:
         """
-        Gets a user by their reference code.
+        Allocates the deposits across portfolios according to the deposit plans.
 
         Args:
-            reference_code (str): The unique reference code of the user.
+            deposit_plan_list (List[DepositPlan]): The deposit plans of the user.
+            deposit_list (List[Deposit]): The deposits made by the user.
 
         Returns:
             Dict[str, float]: A dictionary mapping portfolio name to the total deposit amounts.
@@ -23,52 +25,79 @@ class MakeDepositUsecase(ABC):
 
         if not deposit_plan_list or not deposit_list:
             return {}
+
+        return self.execute_batch(deposit_plan_list, [deposit.amount for deposit in deposit_list])
+
+    def execute_batch(self, deposit_plan_list: List[DepositPlan], deposit_amount_list: List[float]) -> Dict[str, float]:
+        """
+        Allocates raw deposit amounts across portfolios according to the deposit plans.
+        Useful for callers that already hold the amounts and don't need Deposit objects.
+
+        Args:
+            deposit_plan_list (List[DepositPlan]): The deposit plans of the user.
+            deposit_amount_list (List[float]): The amounts of the deposits made by the user.
+
+        Returns:
+            Dict[str, float]: A dictionary mapping portfolio name to the total deposit amounts.
+        """
+
+        if not deposit_plan_list or not deposit_amount_list:
+            return {}
         
-        portfolio_allocation: Dict[str, float] = {}
-        total_deposit_amount = sum(deposit.amount for deposit in deposit_list)
+        total_deposit_amount = sum(deposit_amount_list)
         
-        # Sort deposit plan by type, one_time first, then monthly. This tells the priority
+        # Order deposit plans by type, one_time first, then monthly. This tells the priority
         # of allocation, one_time plans are allocated first. The following action
         # fills the "virtual pot" (deposit plan) in the order of priority.
-        deposit_plan_list.sort(key=lambda plan: plan.plan_type == 'monthly')
+        # Partitioning keeps the relative order within each type and leaves the caller's list untouched.
+        one_time_plan_list = [plan for plan in deposit_plan_list if plan.plan_type == 'one_time']
+        monthly_plan_list = [plan for plan in deposit_plan_list if plan.plan_type != 'one_time']
+        ordered_plan_list = one_time_plan_list + monthly_plan_list
+
+        if total_deposit_amount == 0:
+            # Nothing to allocate, only the first plan in priority order is reported, with zero amounts
+            return dict.fromkeys(ordered_plan_list[0].portfolio_allocation, 0.0)
         
+        portfolio_allocation: DefaultDict[str, float] = defaultdict(float)
         remaining_deposit_amount = total_deposit_amount
-        for deposit_plan in deposit_plan_list:
-            pot = DepositPot(
-                portfolio_allocation_limit=deposit_plan.portfolio_allocation.copy(),
-                portfolio_allocation={}
-            )
-            pot.allocate_deposit(remaining_deposit_amount)
-            remaining_deposit_amount -= pot.get_total_allocation_amount()
+        # a single pot is reset for each plan rather than building a new one every iteration
+        pot = DepositPot(portfolio_allocation_limit={}, portfolio_allocation={})
+        for deposit_plan in ordered_plan_list:
+            pot.reset(deposit_plan.portfolio_allocation)
+            # the excess that does not fit into this pot carries over to the next one
+            remaining_deposit_amount = pot.allocate_deposit(remaining_deposit_amount)
             
-            # add the portfolio allocation to the total portfolio allocation
-            for portfolio, amount in pot.portfolio_allocation.items():
-                portfolio_allocation[portfolio] = portfolio_allocation.get(portfolio, 0.0) + amount
+            # add the portfolio allocation to the total portfolio allocation. Every portfolio of the plan
+            # is included, even when the pot skipped allocating because there was nothing to take
+            pot_allocation = pot.portfolio_allocation
+            for portfolio in deposit_plan.portfolio_allocation:
+                portfolio_allocation[portfolio] += pot_allocation[portfolio]
 
             run_out_of_deposit = remaining_deposit_amount <= 0
             if run_out_of_deposit:
                 break            
 
         if remaining_deposit_amount > 0:
-            # use "monthly" allocation ratio, if not use "one_time" (hence referring to last item in the sorted deposit plan list)
-            remaining_allocation_ratio = deposit_plan_list[-1].get_allocation_ratio()
+            # use "monthly" allocation ratio, if not use "one_time" (hence referring to last item in the ordered deposit plan list).
+            # The loop only finishes with deposit left over after filling the last plan's pot, so its precomputed ratios are reused.
+            remaining_allocation_ratio = pot.get_portfolio_allocation_ratio()
             self._add_remaining_allocation(portfolio_allocation, remaining_allocation_ratio, remaining_deposit_amount)
         
-        return portfolio_allocation
+        return dict(portfolio_allocation)
 
-    def _add_remaining_allocation(self, portfolio_allocation: Dict[str, float], allocation_ratio: Dict[str, float], remaining_amount: float) -> Dict[str, float]:
+    def _add_remaining_allocation(self, portfolio_allocation: DefaultDict[str, float], allocation_ratio: Dict[str, float], remaining_amount: float) -> DefaultDict[str, float]:
         """
         Calculates the remaining allocation for each portfolio based on the allocation ratio and remaining amount.
 
         Args:
-            portfolio_allocation (Dict[str, float]): The current portfolio allocation.
+            portfolio_allocation (DefaultDict[str, float]): The current portfolio allocation.
             allocation_ratio (Dict[str, float]): The allocation ratio for each portfolio.
             remaining_amount (float): The remaining amount to be allocated.
 
         Returns:
-            Dict[str, float]: The updated portfolio allocation.
+            DefaultDict[str, float]: The updated portfolio allocation.
         """
         for portfolio, ratio in allocation_ratio.items():
-            portfolio_allocation[portfolio] = portfolio_allocation.get(portfolio, 0.0) + ratio * remaining_amount
+            portfolio_allocation[portfolio] += ratio * remaining_amount
 
         return portfolio_allocation
@@ -1,11 +1,6 @@
 import pytest
-import sys
-import os
 from typing import Dict
 
-# Add the src directory to the Python path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
-
 from domain.entity.deposit_pot_entity import DepositPot
 
 
@@ -60,6 +55,10 @@ class TestDepositPot:
         assert deposit_pot.portfolio_allocation_limit == sample_portfolio_limits
         assert deposit_pot.portfolio_allocation == sample_portfolio_allocation
 
+    def test_deposit_pot_uses_slots(self, deposit_pot):
+        """Test that DepositPot instances are slotted and carry no __dict__."""
+        assert not hasattr(deposit_pot, "__dict__")
+
     def test_get_total_allocation_limit(self, deposit_pot):
         """Test getting total allocation limit."""
         expected_total = 1000.0 + 500.0 + 250.0
@@ -72,6 +71,16 @@ class TestDepositPot:
         expected_remaining = total_limit - total_allocated  # 1400.0
         assert deposit_pot.get_remaining_allocation_total_amount() == expected_remaining
 
+    def test_get_total_allocation_amount(self, deposit_pot):
+        """Test that the total allocation amount follows sequential allocations."""
+        assert deposit_pot.get_total_allocation_amount() == 350.0
+
+        deposit_pot.allocate_deposit(400.0)
+        deposit_pot.allocate_deposit(2000.0)
+
+        assert abs(deposit_pot.get_total_allocation_amount() - sum(deposit_pot.portfolio_allocation.values())) < 1e-10
+        assert abs(deposit_pot.get_total_allocation_amount() - 1750.0) < 1e-10
+
     def test_get_portfolio_allocation_ratio(self, deposit_pot):
         """Test getting portfolio allocation ratios."""
         ratios = deposit_pot.get_portfolio_allocation_ratio()
@@ -96,6 +105,37 @@ class TestDepositPot:
         expected_ratios = {"Portfolio A": 0.0, "Portfolio B": 0.0}
         assert ratios == expected_ratios
 
+    @pytest.mark.parametrize("portfolio_allocation,deposit_amounts", [
+        ({"Portfolio A": 50.0}, [10.0, 10.0]),
+        ({}, [-5.0, 10.0]),
+    ], ids=["overfull", "negative_amount"])
+    def test_zero_limit_pot_total_allocation_amount(self, portfolio_allocation, deposit_amounts):
+        """Test that a pot with zero limits keeps its total allocation amount in sync with its allocations."""
+        zero_pot = DepositPot(
+            portfolio_allocation_limit={"Portfolio A": 0.0},
+            portfolio_allocation=portfolio_allocation
+        )
+
+        for deposit_amount in deposit_amounts:
+            zero_pot.allocate_deposit(deposit_amount)
+            assert zero_pot.get_total_allocation_amount() == sum(zero_pot.portfolio_allocation.values())
+
+    @pytest.mark.parametrize("portfolio_allocation_limit,portfolio_allocation,deposit_amounts,expected_excesses", [
+        ({"Portfolio A": 0.0}, {"Portfolio A": 50.0}, [10.0, 10.0], [60.0, 60.0]),
+        ({"Portfolio A": 0.0}, {}, [-5.0, 10.0], [0.0, 10.0]),
+        ({"Portfolio A": 1000.0, "Portfolio B": 500.0}, {"Portfolio A": 1100.0, "Portfolio B": 600.0}, [100.0, 100.0], [300.0, 100.0]),
+    ], ids=["zero_limit_overfull", "zero_limit_negative_amount", "overfull"])
+    def test_allocate_deposit_edge_case_excess(self, portfolio_allocation_limit, portfolio_allocation, deposit_amounts, expected_excesses):
+        """Test the excess returned for overfull pots, zero limits and negative amounts."""
+        pot = DepositPot(
+            portfolio_allocation_limit=portfolio_allocation_limit,
+            portfolio_allocation=portfolio_allocation
+        )
+
+        excesses = [pot.allocate_deposit(deposit_amount) for deposit_amount in deposit_amounts]
+
+        assert excesses == pytest.approx(expected_excesses)
+
     def test_is_full_false(self, deposit_pot):
         """Test is_full method when pot is not full."""
         assert not deposit_pot.is_full()
@@ -171,6 +211,14 @@ class TestDepositPot:
         assert excess == 0.0
         assert deposit_pot.portfolio_allocation == initial_allocation
 
+    def test_allocate_deposit_zero_amount_to_empty_pot(self, empty_deposit_pot):
+        """Test that allocating zero to an empty pot leaves it untouched."""
+        excess = empty_deposit_pot.allocate_deposit(0.0)
+
+        assert excess == 0.0
+        assert empty_deposit_pot.portfolio_allocation == {}
+        assert empty_deposit_pot.get_total_allocation_amount() == 0.0
+
     def test_allocate_deposit_to_full_pot(self, full_deposit_pot):
         """Test allocating to an already full pot."""
         deposit_amount = 100.0
@@ -264,6 +312,22 @@ class TestDepositPot:
         total_new_allocation = sum(deposit_pot.portfolio_allocation.values())
         expected_total = 350.0 + small_amount  # Initial 350.0 + 0.01
         assert abs(total_new_allocation - expected_total) < 1e-10
+        assert abs(deposit_pot.get_total_allocation_amount() - expected_total) < 1e-10
+
+    def test_reset(self, deposit_pot):
+        """Test that reset empties the pot and applies the new limits."""
+        deposit_pot.reset({"Portfolio X": 300.0, "Portfolio Y": 100.0})
+
+        assert deposit_pot.portfolio_allocation == {}
+        assert deposit_pot.get_total_allocation_limit() == 400.0
+        assert deposit_pot.get_total_allocation_amount() == 0.0
+        assert deposit_pot.get_portfolio_allocation_ratio() == {"Portfolio X": 0.75, "Portfolio Y": 0.25}
+
+        excess = deposit_pot.allocate_deposit(500.0)
+
+        assert excess == 100.0
+        assert deposit_pot.portfolio_allocation == {"Portfolio X": 300.0, "Portfolio Y": 100.0}
+        assert deposit_pot.is_full()
 
     def test_single_portfolio_allocation(self):
         """Test with a single portfolio."""
@@ -282,7 +346,7 @@ class TestDepositPot:
 
     def test_concurrent_portfolio_updates(self, deposit_pot):
         """Test that portfolio allocations are updated atomically."""
-        initial_total = sum(deposit_pot.portfolio_allocation.values())
+        initial_total = deposit_pot.get_total_allocation_amount()
         deposit_amount = 175.0  # 10% of total limit
         
         excess = deposit_pot.allocate_deposit(deposit_amount)
@@ -290,3 +354,4 @@ class TestDepositPot:
         assert excess == 0.0
         final_total = sum(deposit_pot.portfolio_allocation.values())
         assert abs(final_total - (initial_total + deposit_amount)) < 1e-10
+        assert abs(deposit_pot.get_total_allocation_amount() - final_total) < 1e-10
@@ -1,147 +1,161 @@
 import pytest
-import sys
-import os
 from datetime import datetime
+from enum import Enum
+from functools import lru_cache
 from typing import List, Dict
 
-# Add the src directory to the Python path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
-
 from domain.entity.deposit_plan_entity import DepositPlan
 from domain.entity.deposit_entity import Deposit
 from domain.usecase.make_deposit_usecase import MakeDepositUsecase
 
 
-class TestMakeDepositUsecase:
-    """Test suite for the MakeDepositUsecase class using pytest."""
+_DEPOSITED_AT = datetime(2025, 7, 31)
 
-    @pytest.fixture
-    def usecase(self) -> MakeDepositUsecase:
-        """Fixture providing a MakeDepositUsecase instance."""
-        return MakeDepositUsecase()
+_ONE_TIME_HIGH_RISK_10000_RETIREMENT_500 = DepositPlan(plan_type="one_time", portfolio_allocation={"High risk": 10000, "Retirement": 500})
 
-    @pytest.fixture
-    def sample_datetime(self) -> datetime:
-        """Fixture providing a sample datetime."""
-        return datetime(2025, 7, 31, 12, 0, 0)
 
-    @pytest.mark.parametrize("deposit_plans,deposits,expected_result", [
-        # Test case from example
-        pytest.param(
-            [
-                DepositPlan(plan_type="one_time", portfolio_allocation={"High risk": 10000, "Retirement": 500}),
-                DepositPlan(plan_type="monthly", portfolio_allocation={"High risk": 0, "Retirement": 100})
-            ],
-            [
-                Deposit(id="deposit1", amount=10500.0, reference_code="ref123", deposited_at=datetime(2025, 7, 31)),
-                Deposit(id="deposit2", amount=100.0, reference_code="ref123", deposited_at=datetime(2025, 7, 31))
-            ],
-            {"High risk": 10000.0, "Retirement": 600.0},
-            id="main_example"
-        ),
+@lru_cache(maxsize=None)
+def _deposit(deposit_id: str, amount: float) -> Deposit:
+    """Returns a shared deposit with the common reference code and deposit date."""
+    return Deposit(id=deposit_id, amount=amount, reference_code="ref123", deposited_at=_DEPOSITED_AT)
 
-        # Test case with mixed portfolio
-        pytest.param(
-            [
-                DepositPlan(plan_type="one_time", portfolio_allocation={"High risk": 10000, "Retirement": 500}),
-                DepositPlan(plan_type="monthly", portfolio_allocation={"Medium risk": 300, "Retirement": 100})
-            ],
-            [
-                Deposit(id="deposit1", amount=10000.0, reference_code="ref123", deposited_at=datetime(2025, 7, 31)),
-                Deposit(id="deposit2", amount=600.0, reference_code="ref123", deposited_at=datetime(2025, 7, 31))
-            ],
-            {"High risk": 10000.0, "Medium risk": 75.0,  "Retirement": 525.0},
-            id="mixed_portfolio_example"
-        ),
-        
-        # Test case with exact allocation limits
-        pytest.param(
-            [
-                DepositPlan(plan_type="one_time", portfolio_allocation={"High risk": 1000, "Retirement": 500}),
-            ],
-            [
-                Deposit(id="deposit1", amount=1500.0, reference_code="ref123", deposited_at=datetime(2025, 7, 31)),
-            ],
-            {"High risk": 1000.0, "Retirement": 500.0},
-            id="exact_allocation"
-        ),
-        
-        # Test case with excess amount going to monthly plan
-        pytest.param(
-            [
-                DepositPlan(plan_type="one_time", portfolio_allocation={"High risk": 500, "Retirement": 300}),
-                DepositPlan(plan_type="monthly", portfolio_allocation={"High risk": 200, "Retirement": 100})
-            ],
-            [
-                Deposit(id="deposit1", amount=1200.0, reference_code="ref123", deposited_at=datetime(2025, 7, 31)),
-            ],
-            {"High risk": 500.0 + (400.0 * 2/3), "Retirement": 300.0 + (400.0 * 1/3)},
-            id="excess_to_monthly"
-        ),
-        
-        # Test case with multiple deposits
-        pytest.param(
-            [
-                DepositPlan(plan_type="one_time", portfolio_allocation={"High risk": 800, "Retirement": 200}),
-            ],
-            [
-                Deposit(id="deposit1", amount=500.0, reference_code="ref123", deposited_at=datetime(2025, 7, 31)),
-                Deposit(id="deposit2", amount=300.0, reference_code="ref123", deposited_at=datetime(2025, 7, 31)),
-                Deposit(id="deposit3", amount=200.0, reference_code="ref123", deposited_at=datetime(2025, 7, 31)),
-            ],
-            {"High risk": 800.0, "Retirement": 200.0},
-            id="multiple_deposits"
-        ),
-        
-        # Test case with zero allocation plan
-        pytest.param(
-            [
-                DepositPlan(plan_type="one_time", portfolio_allocation={"High risk": 0, "Retirement": 0}),
-                DepositPlan(plan_type="monthly", portfolio_allocation={"High risk": 100, "Retirement": 50})
-            ],
-            [
-                Deposit(id="deposit1", amount=300.0, reference_code="ref123", deposited_at=datetime(2025, 7, 31)),
-            ],
-            {"High risk": 200.0, "Retirement": 100.0},
-            id="zero_allocation_plan"
-        ),
-        
-        # Test case with only monthly plan
-        pytest.param(
-            [
-                DepositPlan(plan_type="monthly", portfolio_allocation={"High risk": 600, "Retirement": 400})
-            ],
-            [
-                Deposit(id="deposit1", amount=1500.0, reference_code="ref123", deposited_at=datetime(2025, 7, 31)),
-            ],
-            {"High risk": 600.0 + (500.0 * 0.6), "Retirement": 400.0 + (500.0 * 0.4)},
-            id="only_monthly_plan"
-        ),
-        
-        # # Test case with small deposit amounts
-        pytest.param(
-            [
-                DepositPlan(plan_type="one_time", portfolio_allocation={"High risk": 100, "Retirement": 50}),
-            ],
-            [
-                Deposit(id="deposit1", amount=75.0, reference_code="ref123", deposited_at=datetime(2025, 7, 31)),
-            ],
-            {"High risk": 50.0, "Retirement": 25.0},
-            id="small_amounts"
-        ),
-        
-        # Test case with single portfolio
-        pytest.param(
-            [
-                DepositPlan(plan_type="one_time", portfolio_allocation={"High risk": 1000}),
-            ],
-            [
-                Deposit(id="deposit1", amount=800.0, reference_code="ref123", deposited_at=datetime(2025, 7, 31)),
-            ],
-            {"High risk": 800.0},
-            id="single_portfolio"
-        ),
-    ])
+
+# Scenarios for execute, built once at import time: (deposit_plans, deposits, expected_result)
+EXECUTE_CASES = (
+    # Test case from example
+    pytest.param(
+        [
+            _ONE_TIME_HIGH_RISK_10000_RETIREMENT_500,
+            DepositPlan(plan_type="monthly", portfolio_allocation={"High risk": 0, "Retirement": 100})
+        ],
+        [
+            _deposit("deposit1", 10500.0),
+            _deposit("deposit2", 100.0)
+        ],
+        {"High risk": 10000.0, "Retirement": 600.0},
+        id="main_example"
+    ),
+
+    # Test case with mixed portfolio
+    pytest.param(
+        [
+            _ONE_TIME_HIGH_RISK_10000_RETIREMENT_500,
+            DepositPlan(plan_type="monthly", portfolio_allocation={"Medium risk": 300, "Retirement": 100})
+        ],
+        [
+            _deposit("deposit1", 10000.0),
+            _deposit("deposit2", 600.0)
+        ],
+        {"High risk": 10000.0, "Medium risk": 75.0,  "Retirement": 525.0},
+        id="mixed_portfolio_example"
+    ),
+
+    # Test case with exact allocation limits
+    pytest.param(
+        [
+            DepositPlan(plan_type="one_time", portfolio_allocation={"High risk": 1000, "Retirement": 500}),
+        ],
+        [
+            _deposit("deposit1", 1500.0),
+        ],
+        {"High risk": 1000.0, "Retirement": 500.0},
+        id="exact_allocation"
+    ),
+
+    # Test case with excess amount going to monthly plan
+    pytest.param(
+        [
+            DepositPlan(plan_type="one_time", portfolio_allocation={"High risk": 500, "Retirement": 300}),
+            DepositPlan(plan_type="monthly", portfolio_allocation={"High risk": 200, "Retirement": 100})
+        ],
+        [
+            _deposit("deposit1", 1200.0),
+        ],
+        {"High risk": 500.0 + (400.0 * 2/3), "Retirement": 300.0 + (400.0 * 1/3)},
+        id="excess_to_monthly"
+    ),
+
+    # Test case with multiple deposits
+    pytest.param(
+        [
+            DepositPlan(plan_type="one_time", portfolio_allocation={"High risk": 800, "Retirement": 200}),
+        ],
+        [
+            _deposit("deposit1", 500.0),
+            _deposit("deposit2", 300.0),
+            _deposit("deposit3", 200.0),
+        ],
+        {"High risk": 800.0, "Retirement": 200.0},
+        id="multiple_deposits"
+    ),
+
+    # Test case with zero allocation plan
+    pytest.param(
+        [
+            DepositPlan(plan_type="one_time", portfolio_allocation={"High risk": 0, "Retirement": 0}),
+            DepositPlan(plan_type="monthly", portfolio_allocation={"High risk": 100, "Retirement": 50})
+        ],
+        [
+            _deposit("deposit1", 300.0),
+        ],
+        {"High risk": 200.0, "Retirement": 100.0},
+        id="zero_allocation_plan"
+    ),
+
+    # Test case with only monthly plan
+    pytest.param(
+        [
+            DepositPlan(plan_type="monthly", portfolio_allocation={"High risk": 600, "Retirement": 400})
+        ],
+        [
+            _deposit("deposit1", 1500.0),
+        ],
+        {"High risk": 600.0 + (500.0 * 0.6), "Retirement": 400.0 + (500.0 * 0.4)},
+        id="only_monthly_plan"
+    ),
+
+    # # Test case with small deposit amounts
+    pytest.param(
+        [
+            DepositPlan(plan_type="one_time", portfolio_allocation={"High risk": 100, "Retirement": 50}),
+        ],
+        [
+            _deposit("deposit1", 75.0),
+        ],
+        {"High risk": 50.0, "Retirement": 25.0},
+        id="small_amounts"
+    ),
+
+    # Test case with single portfolio
+    pytest.param(
+        [
+            DepositPlan(plan_type="one_time", portfolio_allocation={"High risk": 1000}),
+        ],
+        [
+            _deposit("deposit1", 800.0),
+        ],
+        {"High risk": 800.0},
+        id="single_portfolio"
+    ),
+)
+
+
+@pytest.fixture(scope="session")
+def usecase() -> MakeDepositUsecase:
+    """Fixture providing a MakeDepositUsecase instance, shared as the usecase is stateless."""
+    return MakeDepositUsecase()
+
+
+@pytest.fixture(scope="session")
+def sample_datetime() -> datetime:
+    """Fixture providing a sample datetime."""
+    return datetime(2025, 7, 31, 12, 0, 0)
+
+
+class TestMakeDepositUsecase:
+    """Test suite for the MakeDepositUsecase class using pytest."""
+
+    @pytest.mark.parametrize("deposit_plans,deposits,expected_result", EXECUTE_CASES)
     def test_execute_parametrized(self, usecase, deposit_plans, deposits, expected_result):
         """Test the execute method with various parametrized scenarios."""
         result = usecase.execute(deposit_plans, deposits)
@@ -149,48 +163,50 @@ class TestMakeDepositUsecase:
         # Check that all expected portfolios are present
         for portfolio, expected_amount in expected_result.items():
             assert portfolio in result
-            assert abs(result[portfolio] - expected_amount) < 1e-2, f"Portfolio {portfolio}: expected {expected_amount}, got {result[portfolio]}"
+            assert result[portfolio] == pytest.approx(expected_amount, abs=1e-2), f"Portfolio {portfolio}"
         
         # Check that no unexpected portfolios are present
         for portfolio in result:
             assert portfolio in expected_result, f"Unexpected portfolio {portfolio} in result"
 
-    def test_execute_empty_deposit_list(self, usecase):
-        """Test execute with empty deposit list."""
-        deposit_plans = [
-            DepositPlan(plan_type="one_time", portfolio_allocation={"High risk": 1000, "Retirement": 500}),
-        ]
-        deposits = []
-        
-        result = usecase.execute(deposit_plans, deposits)
-        
-        # Should return empty result for empty deposits
-        assert result == {}
+    @pytest.mark.parametrize("deposit_plans,deposits,expected_result", [
+        # Empty deposits give an empty result
+        pytest.param(
+            [DepositPlan(plan_type="one_time", portfolio_allocation={"High risk": 1000, "Retirement": 500})],
+            [],
+            {},
+            id="empty_deposit_list"
+        ),
 
-    def test_execute_empty_deposit_plan_list(self, usecase):
-        """Test execute with empty deposit plan list."""
-        deposit_plans = []
-        deposits = [
-            Deposit(id="deposit1", amount=1000.0, reference_code="ref123", deposited_at=datetime(2025, 7, 31)),
-        ]
-        
-        result = usecase.execute(deposit_plans, deposits)
-        
-        # Should return empty result for empty deposit plans
-        assert result == {}
+        # Empty deposit plans give an empty result
+        pytest.param(
+            [],
+            [_deposit("deposit1", 1000.0)],
+            {},
+            id="empty_deposit_plan_list"
+        ),
+
+        # Zero deposits report the plan's portfolios with zero amounts
+        pytest.param(
+            [DepositPlan(plan_type="one_time", portfolio_allocation={"High risk": 1000, "Retirement": 500})],
+            [_deposit("deposit1", 0.0)],
+            {"High risk": 0.0, "Retirement": 0.0},
+            id="zero_deposit_amounts"
+        ),
+    ])
+    def test_execute_degenerate_inputs(self, usecase, deposit_plans, deposits, expected_result):
+        """Test execute with empty or zero-amount inputs."""
+        assert usecase.execute(deposit_plans, deposits) == expected_result
 
-    def test_execute_zero_deposit_amounts(self, usecase):
-        """Test execute with zero deposit amounts."""
+    def test_execute_zero_deposit_amounts_reports_first_plan(self, usecase):
+        """Test that zero deposits report the highest priority plan's portfolios only."""
         deposit_plans = [
-            DepositPlan(plan_type="one_time", portfolio_allocation={"High risk": 1000, "Retirement": 500}),
-        ]
-        deposits = [
-            Deposit(id="deposit1", amount=0.0, reference_code="ref123", deposited_at=datetime(2025, 7, 31)),
+            DepositPlan(plan_type="monthly", portfolio_allocation={"Medium risk": 300, "Retirement": 100}),
+            _ONE_TIME_HIGH_RISK_10000_RETIREMENT_500,
         ]
-        
-        result = usecase.execute(deposit_plans, deposits)
-        
-        # Should return empty result for zero deposits
+
+        result = usecase.execute_batch(deposit_plans, [0.0, 0.0])
+
         assert result == {
             "High risk": 0.0,
             "Retirement": 0.0
@@ -202,14 +218,14 @@ class TestMakeDepositUsecase:
             DepositPlan(plan_type="one_time", portfolio_allocation={"A": 333.33, "B": 333.33, "C": 333.34}),
         ]
         deposits = [
-            Deposit(id="deposit1", amount=1000.0, reference_code="ref123", deposited_at=datetime(2025, 7, 31)),
+            _deposit("deposit1", 1000.0),
         ]
         
         result = usecase.execute(deposit_plans, deposits)
         
         # Total allocation should equal the deposit amount
         total_result = sum(result.values())
-        assert abs(total_result - 1000.0) < 1e-2
+        assert total_result == pytest.approx(1000.0, abs=1e-2)
 
     def test_large_numbers(self, usecase):
         """Test with large monetary amounts."""
@@ -217,7 +233,7 @@ class TestMakeDepositUsecase:
             DepositPlan(plan_type="one_time", portfolio_allocation={"LargeCap": 1000000, "SmallCap": 500000}),
         ]
         deposits = [
-            Deposit(id="deposit1", amount=2000000.0, reference_code="ref123", deposited_at=datetime(2025, 7, 31)),
+            _deposit("deposit1", 2000000.0),
         ]
         
         result = usecase.execute(deposit_plans, deposits)
@@ -226,5 +242,66 @@ class TestMakeDepositUsecase:
         expected_large_cap = 1000000.0 + (500000.0 * 2/3)  # 1333333.33
         expected_small_cap = 500000.0 + (500000.0 * 1/3)   # 666666.67
         
-        assert abs(result["LargeCap"] - expected_large_cap) < 1e-4
-        assert abs(result["SmallCap"] - expected_small_cap) < 1e-4
+        assert result["LargeCap"] == pytest.approx(expected_large_cap, abs=1e-4)
+        assert result["SmallCap"] == pytest.approx(expected_small_cap, abs=1e-4)
+
+    def test_execute_does_not_mutate_deposit_plans(self, usecase):
+        """Test that execute leaves the deposit plan allocations untouched."""
+        one_time_plan = DepositPlan(plan_type="one_time", portfolio_allocation={"High risk": 500, "Retirement": 300})
+        monthly_plan = DepositPlan(plan_type="monthly", portfolio_allocation={"High risk": 200, "Retirement": 100})
+        deposits = [
+            _deposit("deposit1", 1200.0),
+        ]
+
+        usecase.execute([one_time_plan, monthly_plan], deposits)
+
+        assert one_time_plan.portfolio_allocation == {"High risk": 500, "Retirement": 300}
+        assert monthly_plan.portfolio_allocation == {"High risk": 200, "Retirement": 100}
+
+    def test_execute_does_not_reorder_deposit_plan_list(self, usecase):
+        """Test that execute prioritises one_time plans without sorting the caller's list."""
+        monthly_plan = DepositPlan(plan_type="monthly", portfolio_allocation={"Medium risk": 300, "Retirement": 100})
+        one_time_plan = _ONE_TIME_HIGH_RISK_10000_RETIREMENT_500
+        deposit_plans = [monthly_plan, one_time_plan]
+        deposits = [
+            _deposit("deposit1", 10600.0),
+        ]
+
+        result = usecase.execute(deposit_plans, deposits)
+
+        assert deposit_plans == [monthly_plan, one_time_plan]
+        assert result["High risk"] == pytest.approx(10000.0, abs=1e-2)
+        assert result["Medium risk"] == pytest.approx(75.0, abs=1e-2)
+        assert result["Retirement"] == pytest.approx(525.0, abs=1e-2)
+
+    def test_execute_batch_matches_execute(self, usecase):
+        """Test that execute_batch on raw amounts allocates like execute on deposits."""
+        deposit_plans = [
+            _ONE_TIME_HIGH_RISK_10000_RETIREMENT_500,
+            DepositPlan(plan_type="monthly", portfolio_allocation={"Medium risk": 300, "Retirement": 100})
+        ]
+        deposits = [
+            _deposit("deposit1", 10000.0),
+            _deposit("deposit2", 600.0)
+        ]
+
+        result = usecase.execute_batch(deposit_plans, [10000.0, 600.0])
+
+        assert result == usecase.execute(deposit_plans, deposits)
+        assert usecase.execute_batch(deposit_plans, []) == {}
+
+    def test_execute_with_str_subclass_portfolio_keys(self, usecase):
+        """Test that portfolio names may be str subclasses, such as str-based enum members."""
+        class Portfolio(str, Enum):
+            HIGH_RISK = "High risk"
+            RETIREMENT = "Retirement"
+
+        deposit_plan = DepositPlan(plan_type="one_time", portfolio_allocation={Portfolio.HIGH_RISK: 800, Portfolio.RETIREMENT: 200})
+
+        assert deposit_plan.portfolio_allocation == {Portfolio.HIGH_RISK: 800, Portfolio.RETIREMENT: 200}
+        assert all(type(portfolio) is Portfolio for portfolio in deposit_plan.portfolio_allocation)
+
+        result = usecase.execute([deposit_plan], [_deposit("deposit1", 500.0)])
+
+        assert result[Portfolio.HIGH_RISK] == pytest.approx(400.0, abs=1e-2)
+        assert result[Portfolio.RETIREMENT] == pytest.approx(100.0, abs=1e-2)